@@ -4,22 +4,34 @@ API Server for Investment Screening System - Fixed for LightOn Integration
 
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-import tempfile
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
+import orjson
+import asyncio
+import time
 import os
-from typing import List
+from uuid import uuid4
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Tuple
 import logging
 
 # Import your actual clients
-from workflows.investment_screening import execute_workflow
+from workflows.investment_screening import execute_workflow_events
+from workflows.investment_screening import paradigm_client as workflow_paradigm_client
 from clients.paradigm_client import ParadigmClient
-from config.settings import LIGHTON_API_KEY, LIGHTON_BASE_URL
+from config.settings import (
+    LIGHTON_API_KEY, LIGHTON_BASE_URL,
+    SCREENING_CACHE_TTL, SCREENING_CACHE_MAX_ENTRIES
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Investment Screening API", version="1.0.0")
+app = FastAPI(
+    title="Investment Screening API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse
+)
 
 # Enable CORS for frontend
 app.add_middleware(
@@ -33,8 +45,36 @@ app.add_middleware(
 # Initialize Paradigm client
 paradigm_client = ParadigmClient(LIGHTON_API_KEY, LIGHTON_BASE_URL)
 
-# Store uploaded document info locally
-uploaded_documents = {}
+# Store uploaded document info locally. Bounded: uploads that are never
+# deleted would otherwise grow the dict for the lifetime of the process,
+# so past the cap the oldest entry is dropped (the file itself stays on
+# the Paradigm side - this is only local metadata).
+MAX_UPLOADED_DOCUMENTS = 1024
+uploaded_documents: "OrderedDict[int, dict]" = OrderedDict()
+
+# Screening results keyed by document-id set, LRU-ordered with a TTL.
+# Repeat requests for the same documents skip the whole workflow
+# (search, analysis, evaluation, report) and return the cached report.
+screening_cache: "OrderedDict[FrozenSet[int], Tuple[float, str]]" = OrderedDict()
+
+# Screening jobs keyed by job id. /api/screen returns the id immediately
+# and the workflow runs as a background task, so the HTTP request is not
+# held open for the multi-minute analysis; clients poll
+# /api/screen/{job_id} for the outcome, mirroring the polling pattern the
+# Paradigm analysis API itself uses.
+MAX_TRACKED_JOBS = 256
+screening_jobs: "OrderedDict[str, dict]" = OrderedDict()
+
+# Single-flight table: document-id sets with a screening currently running,
+# mapped to the job id. Concurrent identical requests are coalesced onto
+# the in-flight job instead of running the workflow twice.
+in_flight_jobs: Dict[FrozenSet[int], str] = {}
+
+@app.on_event("shutdown")
+async def close_http_sessions():
+    """Close the shared HTTP sessions held by the Paradigm clients"""
+    await paradigm_client.close()
+    await workflow_paradigm_client.close()
 
 @app.get("/", response_class=HTMLResponse)
 async def serve_frontend():
@@ -52,45 +92,44 @@ async def upload_file(file: UploadFile = File(...)):
     """
     try:
         logger.info(f"Uploading file via ParadigmClient: {file.filename}")
-        
-        # Read file content
-        content = await file.read()
-        
-        # Create a temporary file for ParadigmClient upload
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as temp_file:
-            temp_file.write(content)
-            temp_file_path = temp_file.name
-        
-        try:
-            # Use your existing ParadigmClient upload method
-            # You'll need to add this method to your ParadigmClient
-            upload_result = await paradigm_client.upload_file(temp_file_path, file.filename)
-            
-            # Store document info locally
-            document_info = {
-                "id": upload_result["id"],
-                "filename": upload_result.get("filename", file.filename),
-                "bytes": len(content),
-                "status": upload_result.get("status", "uploaded"),
-                "content_type": file.content_type
-            }
-            
-            uploaded_documents[upload_result["id"]] = document_info
-            
-            logger.info(f"File uploaded successfully via ParadigmClient: ID {upload_result['id']}")
-            
-            return {
-                "id": upload_result["id"],
-                "filename": file.filename,
-                "bytes": len(content),
-                "status": "uploaded",
-                "content_type": file.content_type
-            }
-            
-        finally:
-            # Clean up temporary file
-            os.unlink(temp_file_path)
-            
+
+        # Hand the incoming stream straight to the outbound multipart -
+        # UploadFile.file is a SpooledTemporaryFile, so nothing gets
+        # re-written to disk on the way through. Measure the size from the
+        # spool, then rewind before passing it on.
+        spool = file.file
+        spool.seek(0, os.SEEK_END)
+        total_bytes = spool.tell()
+        spool.seek(0)
+
+        upload_result = await paradigm_client.upload_file(
+            spool, file.filename,
+            file.content_type or "application/octet-stream"
+        )
+
+        # Store document info locally
+        document_info = {
+            "id": upload_result["id"],
+            "filename": upload_result.get("filename", file.filename),
+            "bytes": total_bytes,
+            "status": upload_result.get("status", "uploaded"),
+            "content_type": file.content_type
+        }
+
+        uploaded_documents[upload_result["id"]] = document_info
+        if len(uploaded_documents) > MAX_UPLOADED_DOCUMENTS:
+            uploaded_documents.popitem(last=False)
+
+        logger.info(f"File uploaded successfully via ParadigmClient: ID {upload_result['id']}")
+
+        return {
+            "id": upload_result["id"],
+            "filename": file.filename,
+            "bytes": total_bytes,
+            "status": "uploaded",
+            "content_type": file.content_type
+        }
+
     except Exception as e:
         logger.error(f"Upload failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
@@ -112,28 +151,135 @@ async def delete_file(file_id: int):
         logger.error(f"Delete failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Delete failed: {str(e)}")
 
-@app.post("/api/screen")
-async def screen_investment(document_ids: List[int]):
-    """Process investment screening for uploaded documents"""
+async def _run_screening_job(job_id: str, document_ids: List[int]):
+    """Run the screening workflow for a job and record its outcome"""
+    job = screening_jobs[job_id]
+    cache_key = frozenset(document_ids)
     try:
+        cached = screening_cache.get(cache_key)
+        if cached is not None:
+            cached_at, cached_result = cached
+            if time.monotonic() - cached_at < SCREENING_CACHE_TTL:
+                screening_cache.move_to_end(cache_key)
+                logger.info(f"Returning cached screening result for documents: {document_ids}")
+                job["status"] = "completed"
+                job["result"] = cached_result
+                return
+            del screening_cache[cache_key]
+
         logger.info(f"Starting investment screening for documents: {document_ids}")
-        
-        # Execute the investment screening workflow
+
+        # Drive the workflow through its event stream: the workflow reports
+        # failures as a terminal "error" event rather than raising, and only
+        # a real report may be cached and marked completed - a transient
+        # failure must not be replayed for the cache TTL.
         user_input = "Analyze the attached investment opportunity documents"
-        result = await execute_workflow(user_input, document_ids)
-        
-        logger.info("Investment screening completed successfully")
-        
-        return {
-            "success": True,
-            "document_ids": document_ids,
-            "screening_result": result,
-            "message": "Investment screening completed successfully"
-        }
-        
+        outcome = None
+        async for event in execute_workflow_events(user_input, document_ids):
+            outcome = event
+
+        if outcome is not None and outcome["stage"] == "report":
+            result = outcome["report"]
+            logger.info("Investment screening completed successfully")
+
+            screening_cache[cache_key] = (time.monotonic(), result)
+            if len(screening_cache) > SCREENING_CACHE_MAX_ENTRIES:
+                screening_cache.popitem(last=False)
+
+            job["status"] = "completed"
+            job["result"] = result
+        else:
+            message = outcome["message"] if outcome else "Screening produced no result"
+            logger.error(f"Screening job {job_id} failed: {message}")
+            job["status"] = "failed"
+            job["error"] = message
+
     except Exception as e:
-        logger.error(f"Screening failed: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Screening failed: {str(e)}")
+        logger.error(f"Screening job {job_id} failed: {str(e)}")
+        job["status"] = "failed"
+        job["error"] = str(e)
+
+    finally:
+        if in_flight_jobs.get(cache_key) == job_id:
+            del in_flight_jobs[cache_key]
+
+@app.post("/api/screen", status_code=202)
+async def screen_investment(document_ids: List[int]):
+    """Start an investment screening job and return its id immediately"""
+    # Coalesce onto an identical screening that is already running
+    cache_key = frozenset(document_ids)
+    existing_id = in_flight_jobs.get(cache_key)
+    if existing_id is not None:
+        existing_job = screening_jobs.get(existing_id)
+        if existing_job is not None and existing_job["status"] == "running":
+            logger.info(f"Coalescing screening request onto running job {existing_id}")
+            return {
+                "success": True,
+                "job_id": existing_id,
+                "status": "running",
+                "document_ids": existing_job["document_ids"]
+            }
+
+    job_id = uuid4().hex
+    job = {
+        "document_ids": document_ids,
+        "status": "running",
+        "result": None,
+        "error": None
+    }
+    screening_jobs[job_id] = job
+    in_flight_jobs[cache_key] = job_id
+    if len(screening_jobs) > MAX_TRACKED_JOBS:
+        screening_jobs.popitem(last=False)
+
+    # The job dict keeps a strong reference to the task so it is not
+    # garbage-collected mid-flight
+    job["task"] = asyncio.create_task(_run_screening_job(job_id, document_ids))
+
+    logger.info(f"Queued screening job {job_id} for documents: {document_ids}")
+
+    return {
+        "success": True,
+        "job_id": job_id,
+        "status": "running",
+        "document_ids": document_ids
+    }
+
+@app.post("/api/screen/stream")
+async def screen_investment_stream(document_ids: List[int]):
+    """Stream screening progress and the final report as Server-Sent Events
+
+    Each workflow stage is pushed as a `data:` event the moment it starts,
+    so clients can render progress live instead of waiting for the full
+    report; the last event carries the report (or the error).
+    """
+    async def event_stream():
+        user_input = "Analyze the attached investment opportunity documents"
+        async for event in execute_workflow_events(user_input, document_ids):
+            yield b"data: " + orjson.dumps(event) + b"\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+@app.get("/api/screen/{job_id}")
+async def get_screening_job(job_id: str):
+    """Report the status (and, once finished, the result) of a screening job"""
+    job = screening_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown screening job: {job_id}")
+
+    response = {
+        "job_id": job_id,
+        "status": job["status"],
+        "document_ids": job["document_ids"]
+    }
+    if job["status"] == "completed":
+        response["success"] = True
+        response["screening_result"] = job["result"]
+        response["message"] = "Investment screening completed successfully"
+    elif job["status"] == "failed":
+        response["success"] = False
+        response["error"] = job["error"]
+    return response
 
 @app.get("/api/health")
 async def health_check():
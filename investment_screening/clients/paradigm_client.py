@@ -3,16 +3,28 @@ ParadigmClient - API client for LightOn/Paradigm services
 """
 
 import asyncio
-import aiohttp
+import hashlib
 import logging
-from typing import List, Dict, Any
-from config.settings import MAX_WAIT_TIME, POLL_INTERVAL
+import random
+
+import httpx
+import orjson
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
+from config.settings import MAX_WAIT_TIME, POLL_INITIAL_DELAY, POLL_MAX_DELAY
 
 logger = logging.getLogger(__name__)
 
+# Terminal analysis states, checked once per poll iteration
+_DONE_STATUSES = frozenset({"completed", "complete", "finished", "success"})
+_FAILED_STATUSES = frozenset({"failed", "error"})
+
+# Entries kept in the per-client LLM response cache
+_RESPONSE_CACHE_MAX = 256
+
 class ParadigmClient:
     """Client for interacting with LightOn/Paradigm API"""
-    
+
     def __init__(self, api_key: str, base_url: str):
         self.base_url = base_url
         self.api_key = api_key
@@ -20,135 +32,208 @@ class ParadigmClient:
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}"
         }
-    
-    async def upload_file(self, file_path: str, filename: str) -> Dict[str, Any]:
-        """Upload a file to LightOn/Paradigm"""
+        self._client: Optional[httpx.AsyncClient] = None
+        # Working endpoints discovered by the first successful probe; once
+        # known, later calls skip the failed round-trips to the other
+        # candidates
+        self._upload_endpoint: Optional[str] = None
+        self._delete_endpoint_template: Optional[str] = None
+        # LRU of chat/search responses keyed by request hash - an exact
+        # repeat of a prompt skips the whole LLM roundtrip
+        self._response_cache: "OrderedDict[bytes, Any]" = OrderedDict()
+
+    def _cache_get(self, key: bytes) -> Any:
+        """Return a cached response and refresh its LRU position"""
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+        return cached
+
+    def _cache_put(self, key: bytes, value: Any) -> None:
+        """Store a response, evicting the least recently used past the cap"""
+        self._response_cache[key] = value
+        if len(self._response_cache) > _RESPONSE_CACHE_MAX:
+            self._response_cache.popitem(last=False)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazily create the shared HTTP client
+
+        One client for the lifetime of the instance keeps connections alive
+        between requests, and HTTP/2 multiplexes concurrent requests over a
+        single connection with compressed headers - the polling loop's small
+        GETs benefit the most.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(120.0, connect=5.0),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                headers={"Authorization": f"Bearer {self.api_key}"}
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
+    async def upload_file(self, file_obj, filename: str,
+                          content_type: str = 'application/octet-stream') -> Dict[str, Any]:
+        """Upload a file-like object to LightOn/Paradigm
+
+        The caller owns the handle; it is rewound before each attempt and
+        streamed straight into the outbound multipart body.
+        """
         try:
-            # Try different possible endpoints
-            possible_endpoints = [
-                f"{self.base_url}/api/v2/files/upload",
-                f"{self.base_url}/files/upload", 
-                f"{self.base_url}/api/files/upload"
-            ]
-            
+            # Try the endpoint that worked last time first; probe the
+            # alternatives only until one succeeds
+            if self._upload_endpoint:
+                possible_endpoints = [self._upload_endpoint]
+            else:
+                possible_endpoints = [
+                    f"{self.base_url}/api/v2/files/upload",
+                    f"{self.base_url}/files/upload",
+                    f"{self.base_url}/api/files/upload"
+                ]
+
+            client = self._get_client()
             for endpoint in possible_endpoints:
                 try:
-                    logger.info(f"Trying upload endpoint: {endpoint}")
-                    
-                    # Prepare file upload
-                    form_data = aiohttp.FormData()
-                    form_data.add_field('file', 
-                                      open(file_path, 'rb'), 
-                                      filename=filename,
-                                      content_type='application/octet-stream')
-                    form_data.add_field('collection_type', 'private')
-                    
-                    # Upload without Content-Type header for multipart
-                    headers = {"Authorization": f"Bearer {self.api_key}"}
-                    
-                    async with aiohttp.ClientSession() as session:
-                        async with session.post(endpoint, headers=headers, data=form_data) as response:
-                            if response.status == 200:
-                                result = await response.json()
-                                logger.info(f"Upload successful via {endpoint}")
-                                return result
-                            else:
-                                error_text = await response.text()
-                                logger.warning(f"Upload failed via {endpoint}: {response.status} - {error_text}")
-                                
+                    logger.debug("Trying upload endpoint: %s", endpoint)
+
+                    # Rewind so a retry against another endpoint resends the
+                    # stream from the start
+                    await asyncio.to_thread(file_obj.seek, 0)
+
+                    # httpx sets the multipart Content-Type itself
+                    response = await client.post(
+                        endpoint,
+                        files={"file": (filename, file_obj, content_type)},
+                        data={"collection_type": "private"}
+                    )
+                    if response.status_code == 200:
+                        result = response.json()
+                        logger.info("Upload successful via %s", endpoint)
+                        self._upload_endpoint = endpoint
+                        return result
+                    else:
+                        logger.warning("Upload failed via %s: %s - %s", endpoint, response.status_code, response.text)
+
                 except Exception as e:
-                    logger.warning(f"Upload attempt failed for {endpoint}: {str(e)}")
+                    logger.warning("Upload attempt failed for %s: %s", endpoint, e)
                     continue
-            
-            # If all endpoints failed
+
+            # If all endpoints failed, re-probe from scratch next time
+            self._upload_endpoint = None
             raise Exception("All upload endpoints failed")
-            
+
         except Exception as e:
-            logger.error(f"File upload error: {str(e)}")
+            logger.error("File upload error: %s", e)
             raise e
-    
+
     async def delete_file(self, file_id: int) -> bool:
         """Delete a file from LightOn/Paradigm"""
         try:
-            possible_endpoints = [
-                f"{self.base_url}/api/v2/files/{file_id}",
-                f"{self.base_url}/files/{file_id}",
-                f"{self.base_url}/api/files/{file_id}"
-            ]
-            
-            for endpoint in possible_endpoints:
+            if self._delete_endpoint_template:
+                possible_templates = [self._delete_endpoint_template]
+            else:
+                possible_templates = [
+                    f"{self.base_url}/api/v2/files/{{file_id}}",
+                    f"{self.base_url}/files/{{file_id}}",
+                    f"{self.base_url}/api/files/{{file_id}}"
+                ]
+
+            client = self._get_client()
+            for template in possible_templates:
+                endpoint = template.format(file_id=file_id)
                 try:
-                    async with aiohttp.ClientSession() as session:
-                        async with session.delete(endpoint, headers=self.headers) as response:
-                            if response.status in [200, 204, 404]:  # 404 means already deleted
-                                logger.info(f"Delete successful via {endpoint}")
-                                return True
-                            else:
-                                error_text = await response.text()
-                                logger.warning(f"Delete failed via {endpoint}: {response.status} - {error_text}")
-                                
+                    response = await client.delete(endpoint)
+                    if response.status_code in [200, 204, 404]:  # 404 means already deleted
+                        logger.info("Delete successful via %s", endpoint)
+                        self._delete_endpoint_template = template
+                        return True
+                    else:
+                        logger.warning("Delete failed via %s: %s - %s", endpoint, response.status_code, response.text)
+
                 except Exception as e:
-                    logger.warning(f"Delete attempt failed for {endpoint}: {str(e)}")
+                    logger.warning("Delete attempt failed for %s: %s", endpoint, e)
                     continue
-            
+
+            self._delete_endpoint_template = None
             raise Exception("All delete endpoints failed")
-            
+
         except Exception as e:
-            logger.error(f"File delete error: {str(e)}")
+            logger.error("File delete error: %s", e)
             raise e
 
     async def document_search(self, query: str, **kwargs) -> Dict[str, Any]:
         """Search for documents using the provided query"""
         endpoint = f"{self.base_url}/api/v2/chat/document-search"
         payload = {"query": query, **kwargs}
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.post(endpoint, json=payload, headers=self.headers) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    raise Exception(f"API error {response.status}: {await response.text()}")
-    
+        body = orjson.dumps(payload)
+
+        cache_key = hashlib.sha256(b"search\x00" + body).digest()
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        client = self._get_client()
+        response = await client.post(endpoint, content=body, headers=self.headers)
+        if response.status_code == 200:
+            result = response.json()
+            self._cache_put(cache_key, result)
+            return result
+        else:
+            raise Exception(f"API error {response.status_code}: {response.text}")
+
     async def analyze_documents_with_polling(self, query: str, document_ids: List[int], **kwargs) -> str:
         """Analyze documents with polling for completion"""
         # Start analysis
         endpoint = f"{self.base_url}/api/v2/chat/document-analysis"
         payload = {"query": query, "document_ids": document_ids, **kwargs}
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.post(endpoint, json=payload, headers=self.headers) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    chat_response_id = result.get("chat_response_id")
-                else:
-                    raise Exception(f"Analysis API error {response.status}: {await response.text()}")
-        
-        # Poll for results
-        elapsed = 0
-        
-        while elapsed < MAX_WAIT_TIME:
-            endpoint = f"{self.base_url}/api/v2/chat/document-analysis/{chat_response_id}"
-            async with aiohttp.ClientSession() as session:
-                async with session.get(endpoint, headers=self.headers) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        status = result.get("status", "")
-                        if status.lower() in ["completed", "complete", "finished", "success"]:
-                            analysis_result = result.get("result") or result.get("detailed_analysis") or "Analysis completed"
-                            return analysis_result
-                        elif status.lower() in ["failed", "error"]:
-                            raise Exception(f"Analysis failed: {status}")
-                    elif response.status == 404:
-                        # Analysis not ready yet, continue polling
-                        pass
-                    else:
-                        raise Exception(f"Polling API error {response.status}: {await response.text()}")
-                    
-                    await asyncio.sleep(POLL_INTERVAL)
-                    elapsed += POLL_INTERVAL
-        
+
+        client = self._get_client()
+        response = await client.post(endpoint, content=orjson.dumps(payload), headers=self.headers)
+        if response.status_code == 200:
+            chat_response_id = response.json().get("chat_response_id")
+        else:
+            raise Exception(f"Analysis API error {response.status_code}: {response.text}")
+
+        # Poll for results over the same client - no reconnect per iteration.
+        # The first poll fires immediately, then the delay doubles from
+        # POLL_INITIAL_DELAY up to POLL_MAX_DELAY with jitter: fast analyses
+        # are picked up within a second instead of waiting a fixed interval,
+        # and slow ones stop hammering the status endpoint.
+        endpoint = f"{self.base_url}/api/v2/chat/document-analysis/{chat_response_id}"
+        elapsed = 0.0
+        delay = POLL_INITIAL_DELAY
+
+        while True:
+            response = await client.get(endpoint)
+            if response.status_code == 200:
+                result = response.json()
+                status = result.get("status", "").lower()
+                if status in _DONE_STATUSES:
+                    analysis_result = result.get("result") or result.get("detailed_analysis") or "Analysis completed"
+                    return analysis_result
+                elif status in _FAILED_STATUSES:
+                    raise Exception(f"Analysis failed: {status}")
+            elif response.status_code == 404:
+                # Analysis not ready yet, continue polling
+                pass
+            else:
+                raise Exception(f"Polling API error {response.status_code}: {response.text}")
+
+            if elapsed >= MAX_WAIT_TIME:
+                break
+
+            sleep_for = delay + random.uniform(0, 0.25 * delay)
+            await asyncio.sleep(sleep_for)
+            elapsed += sleep_for
+            delay = min(delay * 2, POLL_MAX_DELAY)
+
         raise Exception("Analysis timed out")
-    
+
     async def chat_completion(self, prompt: str, model: str = "alfred-4.2") -> str:
         """Generate chat completion using the specified model"""
         endpoint = f"{self.base_url}/api/v2/chat/completions"
@@ -159,11 +244,17 @@ class ParadigmClient:
                 {"role": "user", "content": prompt}
             ]
         }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.post(endpoint, json=payload, headers=self.headers) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result["choices"][0]["message"]["content"]
-                else:
-                    raise Exception(f"Paradigm chat completion API error {response.status}: {await response.text()}")
\ No newline at end of file
+
+        cache_key = hashlib.sha256(f"chat\x00{model}\x00{prompt}".encode()).digest()
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        client = self._get_client()
+        response = await client.post(endpoint, content=orjson.dumps(payload), headers=self.headers)
+        if response.status_code == 200:
+            content = response.json()["choices"][0]["message"]["content"]
+            self._cache_put(cache_key, content)
+            return content
+        else:
+            raise Exception(f"Paradigm chat completion API error {response.status_code}: {response.text}")
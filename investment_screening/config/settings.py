@@ -3,6 +3,7 @@ Configuration settings for the Investment Screening System
 """
 
 import os
+import sys
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -15,8 +16,13 @@ LIGHTON_BASE_URL = os.getenv("LIGHTON_BASE_URL", "https://api.lighton.ai")
 
 # Workflow Configuration
 MAX_WAIT_TIME = 300  # 5 minutes for polling
-POLL_INTERVAL = 5  # 5 seconds between polls
+POLL_INITIAL_DELAY = 0.5  # First backoff step between polls (seconds)
+POLL_MAX_DELAY = 8.0  # Backoff cap between polls (seconds)
 MAX_DOCUMENTS_PER_BATCH = 5
+MAX_CONCURRENT_ANALYSES = 4  # Parallel document-analysis batches
+SCREENING_CACHE_TTL = 600  # Seconds a screening result stays reusable
+SCREENING_CACHE_MAX_ENTRIES = 128
+SKIP_LLM_REPORT_ON_REJECT = True  # Render clear-reject reports locally, no LLM call
 
 # Investment Criteria Thresholds
 MIN_INVESTMENT_SIZE = 5.0  # Million USD
@@ -51,9 +57,11 @@ FUND_TYPES = [
 ]
 
 # Evaluation Status
+# Interned so status checks degrade to pointer comparison - every result
+# status is one of these two objects, never an equal copy
 class EvaluationStatus:
-    MET = "MET"
-    NOT_MET = "NOT MET"
+    MET = sys.intern("MET")
+    NOT_MET = sys.intern("NOT MET")
 
 # Colors for status indication
 STATUS_COLORS = {
@@ -4,324 +4,362 @@ All evaluation functions for the 9 investment criteria
 """
 
 import re
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, FrozenSet, Optional, Tuple
 from config.settings import (
-    EvaluationStatus, MIN_DIVIDEND_YIELD, MIN_INVESTMENT_SIZE, 
+    EvaluationStatus, MIN_DIVIDEND_YIELD, MIN_INVESTMENT_SIZE,
     PREFERRED_INVESTMENT_SIZE, MIN_TIMELINE_WEEKS, MIN_KGI_TIMELINE_WEEKS,
     MIN_IRR_THRESHOLD, TARGET_SECTORS, EXCLUDED_SECTORS, FUND_TYPES
 )
 from utils.helpers import (
-    create_evaluation_result, check_keywords_present, check_all_keywords_present,
+    EvalResult, met_result, not_met_result,
     extract_yield_percentage, extract_investment_amount, extract_timeline_weeks,
     extract_irr_percentage, format_currency, format_percentage
 )
 
+# =============================================================================
+# SHARED KEYWORD SCAN
+# =============================================================================
+# Each criterion used to scan the full text independently for its own keyword
+# list, so one screening walked the text dozens of times. All keywords are
+# gathered here into a single table so the text is scanned once per evaluation
+# and the criteria checks become set-membership lookups on the hit set.
+
+# Keyword groups used by the criteria checks (all lowercase)
+_KW_GCC = ("gcc",)
+_KW_JV = ("joint venture", "jv")
+_KW_EXPANSION = ("expansion", "partner", "business model", "proven")
+_KW_DIVIDEND = ("dividend",)
+_KW_KGI = ("kgi",)
+_KW_COINVESTMENT = ("co-investment", "participation")
+_KW_NEW = ("new",)
+_KW_EBITDA_POSITIVE = ("ebitda positive", "positive ebitda")
+_KW_TIMELINE_WITHIN_YEAR = ("within one year", "12 months", "less than a year")
+_KW_ADDITIONAL_FUNDING = ("additional funding", "more funding", "next round", "series")
+_KW_DIRECT_INVESTMENT = ("company", "business", "startup", "direct investment")
+_KW_LEAD_INVESTOR = ("lead investor",)
+_KW_NO_MANAGEMENT_FEES = ("no management fee", "no direct management fee")
+_KW_MANAGEMENT_FEE = ("management fee",)
+_KW_LOW_RISK = ("low risk", "low-risk")
+_KW_FUND_TYPES = tuple(kw.lower() for kw in FUND_TYPES)
+_KW_TARGET_SECTORS = tuple(kw.lower() for kw in TARGET_SECTORS)
+_KW_EXCLUDED_SECTORS = tuple(kw.lower() for kw in EXCLUDED_SECTORS)
+
+# Every keyword any criterion looks for, deduplicated for the single scan
+_ALL_KEYWORDS: Tuple[str, ...] = tuple(sorted(set(
+    _KW_GCC + _KW_JV + _KW_EXPANSION + _KW_DIVIDEND + _KW_KGI +
+    _KW_COINVESTMENT + _KW_NEW + _KW_EBITDA_POSITIVE +
+    _KW_TIMELINE_WITHIN_YEAR + _KW_ADDITIONAL_FUNDING +
+    _KW_DIRECT_INVESTMENT + _KW_LEAD_INVESTOR + _KW_NO_MANAGEMENT_FEES +
+    _KW_MANAGEMENT_FEE + _KW_LOW_RISK + _KW_FUND_TYPES +
+    _KW_TARGET_SECTORS + _KW_EXCLUDED_SECTORS
+)))
+
+# Optional Aho-Corasick acceleration: one automaton pass over the text finds
+# all keywords at once instead of one substring scan per keyword
+try:
+    import ahocorasick
+
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _kw in _ALL_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_kw, _kw)
+    _KEYWORD_AUTOMATON.make_automaton()
+except ImportError:
+    _KEYWORD_AUTOMATON = None
+
+@lru_cache(maxsize=32)
+def _to_lower(analysis_text: str) -> str:
+    """Lowercase the analysis text, skipping the copy when already lowered
+
+    islower() is an allocation-free C scan, so texts that arrive already
+    lowercased (the common case for cached/batch runs) avoid duplicating
+    the whole string. The lru_cache keeps recently lowered texts around so
+    evaluators called individually on the same document share one copy.
+    """
+    return analysis_text if analysis_text.islower() else analysis_text.lower()
+
+def scan_keyword_hits(text_lower: str) -> FrozenSet[str]:
+    """Scan the lowercased analysis text once and return the set of keywords found"""
+    if _KEYWORD_AUTOMATON is not None:
+        return frozenset(kw for _, kw in _KEYWORD_AUTOMATON.iter(text_lower))
+    return frozenset(kw for kw in _ALL_KEYWORDS if kw in text_lower)
+
+def _any_present(hits: FrozenSet[str], keywords: Tuple[str, ...]) -> bool:
+    """Check if any of the specified keywords are in the precomputed hit set"""
+    # The keyword groups are fixed at import, so the check specializes to a
+    # single C-level set intersection with no Python-level iteration
+    return not hits.isdisjoint(keywords)
+
+def _check_kgi_coinvestment(hits: FrozenSet[str]) -> bool:
+    """Check if this is a KGI co-investment (shared by criteria 1 and 7)"""
+    kgi_present = _any_present(hits, _KW_KGI)
+    coinvestment_present = _any_present(hits, _KW_COINVESTMENT)
+    return kgi_present and coinvestment_present
+
 # =============================================================================
 # CRITERION 1: GEOGRAPHY/STRUCTURE EVALUATOR
 # =============================================================================
 
-def evaluate_geography_structure(analysis_text: str) -> Dict[str, str]:
+def evaluate_geography_structure(analysis_text: str, hits: Optional[FrozenSet[str]] = None) -> EvalResult:
     """
     Evaluate Geography/Structure criterion
-    
+
     Meets criteria if ANY of:
     1. GCC JV opportunity with expansion plans and partner structure
     2. Dividend-paying investment with yield > 4%
     3. KGI co-investment opportunity
     """
-    
-    # Check for GCC JV opportunity
-    gcc_jv_found = _check_gcc_jv_opportunity(analysis_text)
-    
-    # Check for dividend-paying investment
-    dividend_found = _check_dividend_opportunity(analysis_text)
-    
-    # Check for KGI co-investment
-    kgi_found = _check_kgi_opportunity(analysis_text)
-    
-    # Determine result based on findings
-    if gcc_jv_found:
-        return create_evaluation_result(
-            EvaluationStatus.MET,
+    if hits is None:
+        hits = scan_keyword_hits(_to_lower(analysis_text))
+
+    # The three categories are OR'd, so evaluate lazily with the cheapest
+    # predicates first: KGI and GCC JV are pure hit-set lookups, while the
+    # dividend check runs the numeric yield extraction and goes last
+    if _check_kgi_coinvestment(hits):
+        return met_result(
+            "KGI co-investment opportunity identified"
+        )
+    elif _check_gcc_jv_opportunity(hits):
+        return met_result(
             "GCC JV opportunity identified with expansion plans and partner structure"
         )
-    elif dividend_found:
-        return create_evaluation_result(
-            EvaluationStatus.MET,
+    elif _check_dividend_opportunity(analysis_text, hits):
+        return met_result(
             f"Dividend-paying investment with yield greater than {MIN_DIVIDEND_YIELD}%"
         )
-    elif kgi_found:
-        return create_evaluation_result(
-            EvaluationStatus.MET,
-            "KGI co-investment opportunity identified"
-        )
     else:
-        return create_evaluation_result(
-            EvaluationStatus.NOT_MET,
+        return not_met_result(
             f"Does not meet any of the three required categories: GCC JV, dividend-paying (>{MIN_DIVIDEND_YIELD}%), or KGI co-investment"
         )
 
-def _check_gcc_jv_opportunity(analysis_text: str) -> bool:
+def _check_gcc_jv_opportunity(hits: FrozenSet[str]) -> bool:
     """Check for GCC Joint Venture opportunity"""
-    gcc_present = check_keywords_present(analysis_text, ["gcc"])
-    jv_present = check_keywords_present(analysis_text, ["joint venture", "jv"])
-    expansion_indicators = check_keywords_present(analysis_text, ["expansion", "partner", "business model", "proven"])
-    
+    gcc_present = _any_present(hits, _KW_GCC)
+    jv_present = _any_present(hits, _KW_JV)
+    expansion_indicators = _any_present(hits, _KW_EXPANSION)
+
     return gcc_present and jv_present and expansion_indicators
 
-def _check_dividend_opportunity(analysis_text: str) -> bool:
+def _check_dividend_opportunity(analysis_text: str, hits: FrozenSet[str]) -> bool:
     """Check for dividend-paying investment with sufficient yield"""
-    dividend_present = check_keywords_present(analysis_text, ["dividend"])
+    dividend_present = _any_present(hits, _KW_DIVIDEND)
     if not dividend_present:
         return False
-    
+
     yield_percentage = extract_yield_percentage(analysis_text)
     return yield_percentage > MIN_DIVIDEND_YIELD
 
-def _check_kgi_opportunity(analysis_text: str) -> bool:
-    """Check for KGI co-investment opportunity"""
-    kgi_present = check_keywords_present(analysis_text, ["kgi"])
-    coinvestment_present = check_keywords_present(analysis_text, ["co-investment", "participation"])
-    
-    return kgi_present and coinvestment_present
-
 # =============================================================================
 # CRITERION 2: FINANCIAL MILESTONES EVALUATOR
 # =============================================================================
 
-def evaluate_financial_milestones(analysis_text: str) -> Dict[str, str]:
+def evaluate_financial_milestones(analysis_text: str, hits: Optional[FrozenSet[str]] = None) -> EvalResult:
     """
     Evaluate Financial Milestones criterion
-    
+
     Meets criteria if:
     1. New JV (not applicable), OR
-    2. Already EBITDA positive, OR  
+    2. Already EBITDA positive, OR
     3. Timeline to positive EBITDA within one year with current funding
     """
-    
+    if hits is None:
+        hits = scan_keyword_hits(_to_lower(analysis_text))
+
     # Check if it's a new JV
-    is_new_jv = _check_new_jv(analysis_text)
-    
+    is_new_jv = _check_new_jv(hits)
+
     if is_new_jv:
-        return create_evaluation_result(
-            EvaluationStatus.MET,
+        return met_result(
             "Not applicable - New JV"
         )
-    
+
     # Check EBITDA status
-    ebitda_positive = _check_ebitda_positive(analysis_text)
-    
+    ebitda_positive = _check_ebitda_positive(hits)
+
     if ebitda_positive:
-        return create_evaluation_result(
-            EvaluationStatus.MET,
+        return met_result(
             "Company is already EBITDA positive"
         )
-    
+
     # Check timeline and funding requirements
-    timeline_within_year = _check_timeline_within_year(analysis_text)
-    additional_funding_needed = _check_additional_funding_needed(analysis_text)
-    
+    timeline_within_year = _check_timeline_within_year(hits)
+    additional_funding_needed = _check_additional_funding_needed(hits)
+
     if timeline_within_year and not additional_funding_needed:
-        return create_evaluation_result(
-            EvaluationStatus.MET,
+        return met_result(
             "Timeline to positive EBITDA is within one year with current funding"
         )
     else:
-        return create_evaluation_result(
-            EvaluationStatus.NOT_MET,
+        return not_met_result(
             "Timeline exceeds one year or additional funding rounds needed before profitability"
         )
 
-def _check_new_jv(analysis_text: str) -> bool:
+def _check_new_jv(hits: FrozenSet[str]) -> bool:
     """Check if this is a new joint venture"""
-    new_present = check_keywords_present(analysis_text, ["new"])
-    jv_present = check_keywords_present(analysis_text, ["joint venture", "jv"])
+    new_present = _any_present(hits, _KW_NEW)
+    jv_present = _any_present(hits, _KW_JV)
     return new_present and jv_present
 
-def _check_ebitda_positive(analysis_text: str) -> bool:
+def _check_ebitda_positive(hits: FrozenSet[str]) -> bool:
     """Check if company is already EBITDA positive"""
-    return check_keywords_present(analysis_text, ["ebitda positive", "positive ebitda"])
+    return _any_present(hits, _KW_EBITDA_POSITIVE)
 
-def _check_timeline_within_year(analysis_text: str) -> bool:
+def _check_timeline_within_year(hits: FrozenSet[str]) -> bool:
     """Check if timeline to profitability is within one year"""
-    return check_keywords_present(analysis_text, [
-        "within one year", 
-        "12 months", 
-        "less than a year"
-    ])
+    return _any_present(hits, _KW_TIMELINE_WITHIN_YEAR)
 
-def _check_additional_funding_needed(analysis_text: str) -> bool:
+def _check_additional_funding_needed(hits: FrozenSet[str]) -> bool:
     """Check if additional funding rounds are needed"""
-    return check_keywords_present(analysis_text, [
-        "additional funding",
-        "more funding", 
-        "next round",
-        "series"
-    ])
+    return _any_present(hits, _KW_ADDITIONAL_FUNDING)
 
 # =============================================================================
 # CRITERION 3: ASSET CLASS EXCLUSION EVALUATOR
 # =============================================================================
 
-def evaluate_asset_class_exclusion(analysis_text: str) -> Dict[str, str]:
+def evaluate_asset_class_exclusion(analysis_text: str, hits: Optional[FrozenSet[str]] = None) -> EvalResult:
     """
     Evaluate Asset Class Exclusion criterion
-    
+
     Does NOT meet criteria if:
     - Fund investment (due to team bandwidth and 2025 objectives)
-    
+
     Meets criteria if:
     - Direct company investment
     """
-    
+    if hits is None:
+        hits = scan_keyword_hits(_to_lower(analysis_text))
+
     # Check if it's a fund investment
-    is_fund = _check_fund_investment(analysis_text)
-    
+    is_fund = _check_fund_investment(hits)
+
     if is_fund:
-        return create_evaluation_result(
-            EvaluationStatus.NOT_MET,
+        return not_met_result(
             "Fund investment identified - excluded due to team bandwidth and 2025 objectives"
         )
-    
+
     # Check if it's clearly a direct company investment
-    is_direct = _check_direct_investment(analysis_text)
-    
+    is_direct = _check_direct_investment(hits)
+
     if is_direct:
-        return create_evaluation_result(
-            EvaluationStatus.MET,
+        return met_result(
             "Direct company investment identified"
         )
     else:
-        return create_evaluation_result(
-            EvaluationStatus.NOT_MET,
+        return not_met_result(
             "Asset class information unclear or absent"
         )
 
-def _check_fund_investment(analysis_text: str) -> bool:
+def _check_fund_investment(hits: FrozenSet[str]) -> bool:
     """Check if this is a fund investment"""
-    return check_keywords_present(analysis_text, FUND_TYPES)
+    return _any_present(hits, _KW_FUND_TYPES)
 
-def _check_direct_investment(analysis_text: str) -> bool:
+def _check_direct_investment(hits: FrozenSet[str]) -> bool:
     """Check if this is a direct company investment"""
-    return check_keywords_present(analysis_text, [
-        "company",
-        "business", 
-        "startup",
-        "direct investment"
-    ])
+    return _any_present(hits, _KW_DIRECT_INVESTMENT)
 
 # =============================================================================
 # CRITERION 4: INVESTOR SYNDICATION EVALUATOR
 # =============================================================================
 
-def evaluate_investor_syndication(analysis_text: str) -> Dict[str, str]:
+def evaluate_investor_syndication(analysis_text: str, hits: Optional[FrozenSet[str]] = None) -> EvalResult:
     """
     Evaluate Investor Syndication criterion
-    
+
     Always meets criteria per Kanoo Ventures policy:
     - If lead investor identified: positive indicator
     - If no lead investor: not a rejection criterion
     """
-    
-    lead_investor_mentioned = _check_lead_investor(analysis_text)
-    
+    if hits is None:
+        hits = scan_keyword_hits(_to_lower(analysis_text))
+
+    lead_investor_mentioned = _check_lead_investor(hits)
+
     if lead_investor_mentioned:
-        return create_evaluation_result(
-            EvaluationStatus.MET,
+        return met_result(
             "Lead investor identified in syndicate"
         )
     else:
-        return create_evaluation_result(
-            EvaluationStatus.MET,
+        return met_result(
             "No lead investor identified - not a rejection criterion per Kanoo Ventures policy"
         )
 
-def _check_lead_investor(analysis_text: str) -> bool:
+def _check_lead_investor(hits: FrozenSet[str]) -> bool:
     """Check if lead investor is mentioned"""
-    return check_keywords_present(analysis_text, ["lead investor"])
+    return _any_present(hits, _KW_LEAD_INVESTOR)
 
 # =============================================================================
 # CRITERION 5: FEE TERMS EVALUATOR
 # =============================================================================
 
-def evaluate_fee_terms(analysis_text: str) -> Dict[str, str]:
+def evaluate_fee_terms(analysis_text: str, hits: Optional[FrozenSet[str]] = None) -> EvalResult:
     """
     Evaluate Fee Terms criterion
-    
+
     Meets criteria if:
     - No direct management fees that would impact KV P&L
-    
+
     Does NOT meet criteria if:
     - Management fees present that would hit KV P&L
     - Fee information not mentioned (missing info = red flag)
     """
-    
-    no_management_fees = _check_no_management_fees(analysis_text)
-    management_fees_present = _check_management_fees_present(analysis_text)
-    
+    if hits is None:
+        hits = scan_keyword_hits(_to_lower(analysis_text))
+
+    # Computed once and passed down - _check_management_fees_present used to
+    # redo the no-fee check internally
+    no_management_fees = _check_no_management_fees(hits)
+    management_fees_present = _check_management_fees_present(hits, no_management_fees)
+
     if no_management_fees:
-        return create_evaluation_result(
-            EvaluationStatus.MET,
+        return met_result(
             "No direct management fees that would impact KV P&L"
         )
     elif management_fees_present:
-        return create_evaluation_result(
-            EvaluationStatus.NOT_MET,
+        return not_met_result(
             "Management fees present that would hit KV P&L"
         )
     else:
-        return create_evaluation_result(
-            EvaluationStatus.NOT_MET,
+        return not_met_result(
             "Fee information not mentioned - missing information counts as red"
         )
 
-def _check_no_management_fees(analysis_text: str) -> bool:
+def _check_no_management_fees(hits: FrozenSet[str]) -> bool:
     """Check for explicit mention of no management fees"""
-    return check_keywords_present(analysis_text, [
-        "no management fee",
-        "no direct management fee"
-    ])
+    return _any_present(hits, _KW_NO_MANAGEMENT_FEES)
 
-def _check_management_fees_present(analysis_text: str) -> bool:
+def _check_management_fees_present(hits: FrozenSet[str], no_management_fees: bool) -> bool:
     """Check for presence of management fees"""
-    management_fee_present = check_keywords_present(analysis_text, ["management fee"])
-    no_management_fee = _check_no_management_fees(analysis_text)
-    
-    return management_fee_present and not no_management_fee
+    return _any_present(hits, _KW_MANAGEMENT_FEE) and not no_management_fees
 
 # =============================================================================
 # CRITERION 6: INVESTMENT SIZE EVALUATOR
 # =============================================================================
 
-def evaluate_investment_size(analysis_text: str) -> Dict[str, str]:
+def evaluate_investment_size(analysis_text: str) -> EvalResult:
     """
     Evaluate Investment Size criterion
-    
+
     Preferred: >= $7.9m (strong preference)
-    Minimum: >= $5.0m 
+    Minimum: >= $5.0m
     Below minimum: < $5.0m (portfolio management concerns)
     """
-    
+
     investment_amount = extract_investment_amount(analysis_text)
-    
+
     if investment_amount >= PREFERRED_INVESTMENT_SIZE:
-        return create_evaluation_result(
-            EvaluationStatus.MET,
+        return met_result(
             f"Investment size {format_currency(investment_amount)} meets preferred threshold with strong preference noted"
         )
     elif investment_amount >= MIN_INVESTMENT_SIZE:
-        return create_evaluation_result(
-            EvaluationStatus.MET,
+        return met_result(
             f"Investment size {format_currency(investment_amount)} meets minimum threshold with note about preference for larger tickets"
         )
     elif investment_amount > 0 and investment_amount < MIN_INVESTMENT_SIZE:
-        return create_evaluation_result(
-            EvaluationStatus.NOT_MET,
+        return not_met_result(
             f"Investment size {format_currency(investment_amount)} below ${MIN_INVESTMENT_SIZE}m minimum - portfolio management concerns about too many small deals"
         )
     else:
-        return create_evaluation_result(
-            EvaluationStatus.NOT_MET,
+        return not_met_result(
             "Investment size not specified"
         )
 
@@ -329,143 +367,197 @@ def evaluate_investment_size(analysis_text: str) -> Dict[str, str]:
 # CRITERION 7: PROCESS TIMELINE EVALUATOR
 # =============================================================================
 
-def evaluate_process_timeline(analysis_text: str) -> Dict[str, str]:
+def evaluate_process_timeline(analysis_text: str, hits: Optional[FrozenSet[str]] = None) -> EvalResult:
     """
     Evaluate Process Timeline criterion
-    
+
     Meets criteria if:
     - KGI co-investment with >= 3 week timeline (lighter diligence)
     - Standard deal with >= 8 week timeline
-    
+
     Does NOT meet if:
     - Timeline too short (risk of reduced diligence quality)
     - Timeline information absent
     """
-    
+    if hits is None:
+        hits = scan_keyword_hits(_to_lower(analysis_text))
+
     timeline_weeks = extract_timeline_weeks(analysis_text)
-    is_kgi_coinvestment = _check_kgi_coinvestment(analysis_text)
-    
+    is_kgi_coinvestment = _check_kgi_coinvestment(hits)
+
     if is_kgi_coinvestment and timeline_weeks >= MIN_KGI_TIMELINE_WEEKS:
-        return create_evaluation_result(
-            EvaluationStatus.MET,
+        return met_result(
             f"KGI co-investment with {timeline_weeks} week timeline meets lighter diligence requirements"
         )
     elif timeline_weeks >= MIN_TIMELINE_WEEKS:
-        return create_evaluation_result(
-            EvaluationStatus.MET,
+        return met_result(
             f"Timeline of {timeline_weeks} weeks meets standard deal requirements"
         )
     elif timeline_weeks > 0:
-        return create_evaluation_result(
-            EvaluationStatus.NOT_MET,
+        return not_met_result(
             f"Timeline of {timeline_weeks} weeks too short - risk of reduced diligence quality"
         )
     else:
-        return create_evaluation_result(
-            EvaluationStatus.NOT_MET,
+        return not_met_result(
             "Timeline information absent"
         )
 
-def _check_kgi_coinvestment(analysis_text: str) -> bool:
-    """Check if this is a KGI co-investment"""
-    kgi_present = check_keywords_present(analysis_text, ["kgi"])
-    coinvestment_present = check_keywords_present(analysis_text, ["co-investment", "participation"])
-    return kgi_present and coinvestment_present
-
 # =============================================================================
 # CRITERION 8: RETURN THRESHOLD EVALUATOR
 # =============================================================================
 
-def evaluate_return_threshold(analysis_text: str) -> Dict[str, str]:
+def evaluate_return_threshold(analysis_text: str, hits: Optional[FrozenSet[str]] = None) -> EvalResult:
     """
     Evaluate Return Threshold criterion
-    
+
     Meets criteria if:
     - IRR >= 15%, OR
     - IRR < 15% but justified as low-risk opportunity
-    
+
     Does NOT meet if:
     - IRR < 15% without low-risk justification
     - Return projections not provided
     """
-    
+    if hits is None:
+        hits = scan_keyword_hits(_to_lower(analysis_text))
+
     irr_percentage = extract_irr_percentage(analysis_text)
-    low_risk_mentioned = _check_low_risk(analysis_text)
-    
+    low_risk_mentioned = _check_low_risk(hits)
+
     if irr_percentage >= MIN_IRR_THRESHOLD:
-        return create_evaluation_result(
-            EvaluationStatus.MET,
+        return met_result(
             f"IRR of {format_percentage(irr_percentage)} meets {MIN_IRR_THRESHOLD}% threshold"
         )
     elif irr_percentage > 0 and irr_percentage < MIN_IRR_THRESHOLD and low_risk_mentioned:
-        return create_evaluation_result(
-            EvaluationStatus.MET,
+        return met_result(
             f"IRR of {format_percentage(irr_percentage)} below {MIN_IRR_THRESHOLD}% but justified as low-risk opportunity"
         )
     elif irr_percentage > 0 and irr_percentage < MIN_IRR_THRESHOLD:
-        return create_evaluation_result(
-            EvaluationStatus.NOT_MET,
+        return not_met_result(
             f"IRR of {format_percentage(irr_percentage)} below {MIN_IRR_THRESHOLD}% without low-risk justification"
         )
     else:
-        return create_evaluation_result(
-            EvaluationStatus.NOT_MET,
+        return not_met_result(
             "Return projections not provided"
         )
 
-def _check_low_risk(analysis_text: str) -> bool:
+def _check_low_risk(hits: FrozenSet[str]) -> bool:
     """Check if investment is characterized as low-risk"""
-    return check_keywords_present(analysis_text, ["low risk", "low-risk"])
+    return _any_present(hits, _KW_LOW_RISK)
 
 # =============================================================================
 # CRITERION 9: SECTOR FOCUS EVALUATOR
 # =============================================================================
 
-def evaluate_sector_focus(analysis_text: str, met_criteria_count: int) -> Dict[str, str]:
+def evaluate_sector_focus(analysis_text: str, met_criteria_count: int, hits: Optional[FrozenSet[str]] = None) -> EvalResult:
     """
     Evaluate Sector Focus criterion
-    
+
     Meets criteria if:
     - Company operates in target sectors (healthcare, education, data economy, energy transition, industrials)
     - Opportunistic consideration if meets other criteria and not in excluded sectors
-    
+
     Does NOT meet if:
     - Company in consumer or traditional infrastructure sectors
     - Sector information not clear and insufficient other criteria met
     """
-    
+    if hits is None:
+        hits = scan_keyword_hits(_to_lower(analysis_text))
+
     # Check for target sectors
     sector_found = _find_target_sector(analysis_text)
-    
+
     # Check for excluded sectors
-    consumer_found = check_keywords_present(analysis_text, EXCLUDED_SECTORS)
-    
+    consumer_found = _any_present(hits, _KW_EXCLUDED_SECTORS)
+
     if sector_found:
-        return create_evaluation_result(
-            EvaluationStatus.MET,
+        return met_result(
             f"Company operates in {sector_found.title()} - target sector"
         )
     elif consumer_found:
-        return create_evaluation_result(
-            EvaluationStatus.NOT_MET,
+        return not_met_result(
             "Company in consumer or traditional infrastructure sectors"
         )
     else:
         # Check if meets other criteria for opportunistic consideration
         if met_criteria_count >= 6:  # Strong performance in other areas
-            return create_evaluation_result(
-                EvaluationStatus.MET,
+            return met_result(
                 "Opportunistic - meets other criteria and not in excluded sectors"
             )
         else:
-            return create_evaluation_result(
-                EvaluationStatus.NOT_MET,
+            return not_met_result(
                 "Sector information not clear"
             )
 
+# Single alternation over all target sectors - one pass instead of one
+# full-text scan per sector. No word-boundary anchors: the baseline used
+# substring matching ("energy transitions", "healthcareplus" count), the
+# same semantics the excluded-sector hit-set check applies.
+_SECTOR_RE = re.compile(
+    '|'.join(map(re.escape, TARGET_SECTORS)), re.IGNORECASE
+)
+
 def _find_target_sector(analysis_text: str) -> str:
     """Find which target sector the company operates in"""
-    for sector in TARGET_SECTORS:
-        if sector in analysis_text.lower():
-            return sector
-    return ""
\ No newline at end of file
+    found = {match.group(0).lower() for match in _SECTOR_RE.finditer(analysis_text)}
+    if found:
+        # Preserve the baseline's TARGET_SECTORS priority order, not
+        # first-in-text order
+        for sector in TARGET_SECTORS:
+            if sector in found:
+                return sector
+    return ""
+
+# =============================================================================
+# ORCHESTRATOR
+# =============================================================================
+
+def evaluate_all_criteria(analysis_text: str) -> Dict[str, EvalResult]:
+    """
+    Evaluate all 9 investment criteria for one analysis text
+
+    Lowercases the text and scans for keywords exactly once, then shares the
+    resulting hit set across every evaluator instead of letting each one
+    re-lowercase and re-scan the full text. Results are cached per analysis
+    text, so re-screening an identical document skips all the work.
+    """
+    # Shallow-copy so callers can add entries without polluting the cache
+    return dict(_evaluate_all_criteria_cached(analysis_text))
+
+@lru_cache(maxsize=128)
+def _evaluate_all_criteria_cached(analysis_text: str) -> Dict[str, EvalResult]:
+    """Evaluate all criteria for one analysis text (cached on the text itself)"""
+    hits = scan_keyword_hits(_to_lower(analysis_text))
+
+    criteria_evaluations = {
+        "Geography/Structure": evaluate_geography_structure(analysis_text, hits),
+        "Financial Milestones": evaluate_financial_milestones(analysis_text, hits),
+        "Asset Class Exclusion": evaluate_asset_class_exclusion(analysis_text, hits),
+        "Investor Syndication": evaluate_investor_syndication(analysis_text, hits),
+        "Fee Terms": evaluate_fee_terms(analysis_text, hits),
+        "Investment Size": evaluate_investment_size(analysis_text),
+        "Process Timeline": evaluate_process_timeline(analysis_text, hits),
+        "Return Threshold": evaluate_return_threshold(analysis_text, hits),
+    }
+
+    # Sector evaluation needs met criteria count for opportunistic
+    # consideration; pack the 8 statuses into a bitmask and popcount it
+    met_mask = 0
+    for index, result in enumerate(criteria_evaluations.values()):
+        if result.status is EvaluationStatus.MET:
+            met_mask |= 1 << index
+    criteria_evaluations["Sector Focus"] = evaluate_sector_focus(
+        analysis_text, met_mask.bit_count(), hits
+    )
+
+    return criteria_evaluations
+
+def evaluate_batch(texts) -> list:
+    """
+    Evaluate criteria for a batch of analysis texts
+
+    The keyword automaton and compiled regexes are built once at import, so
+    screening a pipeline of documents only pays per-document scan cost;
+    duplicate texts in the batch are served from the evaluation cache.
+    """
+    return [evaluate_all_criteria(text) for text in texts]
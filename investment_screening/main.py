@@ -20,11 +20,12 @@ logger = logging.getLogger(__name__)
 async def main():
     """Main function to run the investment screening workflow"""
     try:
-        # You can modify this to accept command line arguments or user input
+        # Document IDs are passed on the command line, e.g. python main.py 12 34
+        attached_file_ids = [int(arg) for arg in sys.argv[1:]]
         user_input = "Analyze the attached investment opportunity document"
-        
+
         logger.info("Starting investment opportunity screening...")
-        result = await execute_workflow(user_input)
+        result = await execute_workflow(user_input, attached_file_ids)
         
         print("\n" + "="*80)
         print("INVESTMENT SCREENING REPORT")
@@ -65,15 +65,36 @@ def main():
     logger.info("📊 API documentation at: http://localhost:8000/docs")
     logger.info("🛑 Press Ctrl+C to stop the server")
     
-    # Start the server
+    # Start the server. In production (ENV=production) the dev file-watcher
+    # is off and the worker runs on uvloop/httptools; the default dev path
+    # keeps single-worker auto-reload.
+    environment = os.getenv("ENV", "dev")
+
     try:
-        uvicorn.run(
-            "api_server:app",
-            host="0.0.0.0",
-            port=8000,
-            reload=True,  # Auto-reload on code changes
-            log_level="info"
-        )
+        if environment == "production":
+            logger.info("🏭 Production mode: uvloop + httptools, reload off")
+            uvicorn.run(
+                "api_server:app",
+                host="0.0.0.0",
+                port=8000,
+                reload=False,
+                # Screening jobs, the result cache and the single-flight
+                # table live in per-process dicts in api_server, so job
+                # polls must land on the process that started the job.
+                # Keep one worker until that state moves to a shared store.
+                workers=1,
+                loop="uvloop",
+                http="httptools",
+                log_level="info"
+            )
+        else:
+            uvicorn.run(
+                "api_server:app",
+                host="0.0.0.0",
+                port=8000,
+                reload=True,  # Auto-reload on code changes
+                log_level="info"
+            )
     except KeyboardInterrupt:
         logger.info("🛑 Server stopped by user")
     except Exception as e:
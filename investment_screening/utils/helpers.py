@@ -2,69 +2,135 @@
 Utility functions for the Investment Screening System
 """
 
-import re
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, NamedTuple, Optional
 from config.settings import EvaluationStatus, STATUS_COLORS
 
-def create_evaluation_result(status: str, explanation: str) -> Dict[str, str]:
-    """Create a standardized evaluation result dictionary"""
-    return {
-        "status": status,
-        "explanation": explanation,
-        "color": STATUS_COLORS[status]
-    }
+# Prefer google-re2 when available: guaranteed linear-time DFA matching, which
+# protects the lazy-wildcard IRR pattern from backtracking blowups on
+# pathological documents. The stdlib engine remains the fallback.
+try:
+    import re2 as re
+except ImportError:
+    import re
+
+# Precompiled regex patterns - compiled once at import instead of on every
+# call. Case-insensitivity uses the inline (?i) form because google-re2 does
+# not expose the stdlib flag constants.
+_RE_COMPANY = re.compile(r'(?i)company name[:\s]+([^\n\r\.]+)')
+
+# One precompiled pattern per numeric field. Deliberately NOT fused into a
+# single alternation: the lazy IRR wildcard would then consume everything
+# between an "irr" mention and the next percent sign, hiding any amount,
+# week count or percentage inside that span from the other branches.
+_RE_AMOUNT = re.compile(r'\$(\d+(?:\.\d+)?)\s*m')
+_RE_WEEKS = re.compile(r'(\d+)\s*week')
+_RE_IRR = re.compile(r'irr.*?(\d+(?:\.\d+)?)\s*%')
+_RE_PCT = re.compile(r'(\d+(?:\.\d+)?)\s*%')
+
+class EvalResult(NamedTuple):
+    """Standardized evaluation result for one criterion
+
+    An immutable NamedTuple instead of a fresh dict per result - cheaper to
+    allocate, hashable (so whole evaluations can be cached), and read via
+    attribute access rather than key hashing.
+    """
+    status: str
+    explanation: str
+    color: str
+
+def create_evaluation_result(status: str, explanation: str) -> EvalResult:
+    """Create a standardized evaluation result"""
+    return EvalResult(status, explanation, STATUS_COLORS[status])
+
+# Status/color pairs bound at import so the per-result constructors skip the
+# STATUS_COLORS lookup entirely - there are only ever these two outcomes
+_MET_COLOR = STATUS_COLORS[EvaluationStatus.MET]
+_NOT_MET_COLOR = STATUS_COLORS[EvaluationStatus.NOT_MET]
+
+def met_result(explanation: str) -> EvalResult:
+    """Create a MET evaluation result"""
+    return EvalResult(EvaluationStatus.MET, explanation, _MET_COLOR)
+
+def not_met_result(explanation: str) -> EvalResult:
+    """Create a NOT MET evaluation result"""
+    return EvalResult(EvaluationStatus.NOT_MET, explanation, _NOT_MET_COLOR)
 
 def extract_company_name(analysis_text: str) -> str:
     """Extract company name from analysis text"""
-    company_matches = re.search(r'company name[:\s]+([^\n\r\.]+)', analysis_text, re.IGNORECASE)
+    company_matches = _RE_COMPANY.search(analysis_text)
     if company_matches:
         return company_matches.group(1).strip()
     return "Unknown Company"
 
+@lru_cache(maxsize=128)
+def extract_all_numerics(analysis_text: str) -> Dict[str, float]:
+    """Extract investment amount, timeline, IRR and yield together
+
+    The text is lowered once and each field does one cheap search with its
+    precompiled pattern. Cached per analysis text, so the individual
+    extractors below can all delegate here and one screening pays for the
+    scans once no matter how many criteria ask for numbers.
+    """
+    text_lower = analysis_text.lower()
+
+    amount_match = _RE_AMOUNT.search(text_lower)
+    week_match = _RE_WEEKS.search(text_lower)
+    irr_match = _RE_IRR.search(text_lower)
+
+    yield_pct = 0.0
+    for match in _RE_PCT.finditer(text_lower):
+        pct_val = float(match.group(1))
+        if pct_val > 1:  # Assuming yields are typically single digit percentages
+            yield_pct = pct_val
+            break
+
+    return {
+        "investment_amount": float(amount_match.group(1)) if amount_match else 0.0,
+        "timeline_weeks": int(week_match.group(1)) if week_match else 0,
+        "irr_percentage": float(irr_match.group(1)) if irr_match else 0.0,
+        "yield_percentage": yield_pct
+    }
+
 def extract_investment_amount(analysis_text: str) -> float:
     """Extract investment amount in millions from analysis text"""
-    amount_matches = re.findall(r'\$(\d+(?:\.\d+)?)\s*m', analysis_text.lower())
-    if amount_matches:
-        return float(amount_matches[0])
-    return 0.0
+    return extract_all_numerics(analysis_text)["investment_amount"]
 
 def extract_timeline_weeks(analysis_text: str) -> int:
     """Extract timeline in weeks from analysis text"""
-    week_matches = re.findall(r'(\d+)\s*week', analysis_text.lower())
-    if week_matches:
-        return int(week_matches[0])
-    return 0
+    return extract_all_numerics(analysis_text)["timeline_weeks"]
 
 def extract_irr_percentage(analysis_text: str) -> float:
     """Extract IRR percentage from analysis text"""
-    irr_matches = re.findall(r'irr.*?(\d+(?:\.\d+)?)\s*%', analysis_text.lower())
-    if irr_matches:
-        return float(irr_matches[0])
-    return 0.0
+    return extract_all_numerics(analysis_text)["irr_percentage"]
 
 def extract_yield_percentage(analysis_text: str) -> float:
     """Extract dividend yield percentage from analysis text"""
-    yield_matches = re.findall(r'(\d+(?:\.\d+)?)\s*%', analysis_text)
-    for match in yield_matches:
-        yield_val = float(match)
-        if yield_val > 1:  # Assuming yields are typically single digit percentages
-            return yield_val
-    return 0.0
+    return extract_all_numerics(analysis_text)["yield_percentage"]
 
 def check_keywords_present(analysis_text: str, keywords: List[str]) -> bool:
-    """Check if any of the specified keywords are present in the analysis text"""
+    """Check if any of the specified keywords are present in the analysis text
+
+    Keywords must already be lowercase - they are defined as lowercase
+    literals at module level by callers, so lowering them again per call
+    only allocated throwaway strings.
+    """
     text_lower = analysis_text.lower()
-    return any(keyword.lower() in text_lower for keyword in keywords)
+    return any(keyword in text_lower for keyword in keywords)
 
 def check_all_keywords_present(analysis_text: str, keywords: List[str]) -> bool:
-    """Check if all of the specified keywords are present in the analysis text"""
+    """Check if all of the specified keywords are present in the analysis text
+
+    Keywords must already be lowercase (see check_keywords_present).
+    """
     text_lower = analysis_text.lower()
-    return all(keyword.lower() in text_lower for keyword in keywords)
+    return all(keyword in text_lower for keyword in keywords)
 
-def count_met_criteria(criteria_evaluations: Dict[str, Dict[str, str]]) -> int:
+def count_met_criteria(criteria_evaluations: Dict[str, EvalResult]) -> int:
     """Count how many criteria are marked as MET"""
-    return sum(1 for criteria in criteria_evaluations.values() 
-               if criteria["status"] == EvaluationStatus.MET)
+    # Status strings are interned constants, so identity comparison is enough
+    return sum(1 for criteria in criteria_evaluations.values()
+               if criteria.status is EvaluationStatus.MET)
 
 def generate_overall_recommendation(met_count: int, total_count: int) -> str:
     """Generate overall recommendation based on criteria met"""
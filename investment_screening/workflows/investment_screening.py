@@ -3,91 +3,204 @@ Investment Screening Workflow
 Main orchestration of the investment screening process
 """
 
-import json
+import asyncio
 import logging
+
+import orjson
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List
 
-from config.settings import LIGHTON_API_KEY, LIGHTON_BASE_URL, MAX_DOCUMENTS_PER_BATCH
+from config.settings import (
+    LIGHTON_API_KEY, LIGHTON_BASE_URL, MAX_DOCUMENTS_PER_BATCH,
+    MAX_CONCURRENT_ANALYSES, SKIP_LLM_REPORT_ON_REJECT
+)
 from clients.paradigm_client import ParadigmClient
 from utils.helpers import (
-    extract_company_name, count_met_criteria, 
+    EvalResult, extract_company_name, count_met_criteria,
     generate_overall_recommendation
 )
 
 # Import all evaluators from consolidated evaluator module
-from investment_screening.evaluator import (
-    evaluate_geography_structure,
-    evaluate_financial_milestones,
-    evaluate_asset_class_exclusion,
-    evaluate_investor_syndication,
-    evaluate_fee_terms,
-    evaluate_investment_size,
-    evaluate_process_timeline,
-    evaluate_return_threshold,
-    evaluate_sector_focus
-)
+from investment_screening.evaluator import evaluate_all_criteria
 
 logger = logging.getLogger(__name__)
 
 # Initialize client
 paradigm_client = ParadigmClient(LIGHTON_API_KEY, LIGHTON_BASE_URL)
 
-async def execute_workflow(user_input: str, attached_file_ids: Optional[List[int]] = None) -> str:
-    """Execute the complete investment screening workflow"""
-    
+# Prompts built once at import time - both sit on the per-request hot path
+ANALYSIS_QUERY = """Please provide a comprehensive analysis of this investment opportunity document. Extract the following key information:
+
+1. Target company name and full legal entity structure
+2. Detailed business model description including products/services offered
+3. Geographic presence and expansion plans, specifically mentioning any GCC region intentions
+4. Financial information including current EBITDA status, runway to profitability, funding requirements, and dividend policy if mentioned
+5. Investment terms including proposed ticket size, management fees structure, and timeline expectations
+6. Sector classification and sub-sector details
+7. Return projections including IRR if provided
+8. Investor syndicate composition including lead investor status
+9. Partnership or joint venture structures if applicable
+10. Any mentions of KGI involvement or co-investment opportunities
+
+Please be thorough and specific in your analysis, noting when information is not available."""
+
+REPORT_TEMPLATE = """Generate a comprehensive investment screening report with the following information:
+
+COMPANY: {company_name}
+DATE: {current_date}
+ANALYSIS: {detailed_analysis}
+CRITERIA RESULTS: {criteria_json}
+MET CRITERIA: {met_count}/{total_count}
+RECOMMENDATION: {overall_recommendation}
+
+Format the report exactly as follows:
+
+# INVESTMENT OPPORTUNITY SCREENING REPORT
+**Date:** {current_date}
+
+## {company_name}
+
+### Executive Summary
+[Provide 3-5 sentence overview of the opportunity including business model, investment size, and key highlights]
+
+### Detailed Opportunity Summary
+[Provide comprehensive business description, market opportunity, team background if available, and unique value proposition]
+
+### Investment Criteria Evaluation
+
+| Criterion | Evaluation |
+|-----------|------------|
+{criteria_rows}
+
+### Overall Recommendation
+{overall_recommendation}
+
+**Criteria Met:** {met_count} out of {total_count}
+
+### Key Risks and Considerations
+[List any applicable risks and considerations]
+
+---
+*Report generated by Kanoo Ventures Investment Screening System*"""
+
+# Rendered locally for clear rejects - same layout the LLM is asked to
+# produce, with deterministic boilerplate in the free-text sections
+REJECT_REPORT_TEMPLATE = """# INVESTMENT OPPORTUNITY SCREENING REPORT
+**Date:** {current_date}
+
+## {company_name}
+
+### Executive Summary
+{company_name} does not satisfy any substantive investment screening criteria. The opportunity falls outside the investment mandate and is recommended for rejection without further diligence.
+
+### Detailed Opportunity Summary
+No substantive screening criteria were met, so no further review of the opportunity was performed. The detailed document analysis is retained on file.
+
+### Investment Criteria Evaluation
+
+| Criterion | Evaluation |
+|-----------|------------|
+{criteria_rows}
+
+### Overall Recommendation
+{overall_recommendation}
+
+**Criteria Met:** {met_count} out of {total_count}
+
+### Key Risks and Considerations
+- No substantive screening criteria were met; proceeding would require an explicit exception to the investment mandate.
+
+---
+*Report generated by Kanoo Ventures Investment Screening System*"""
+
+async def execute_workflow_events(user_input: str, attached_file_ids: List[int]):
+    """Run the screening workflow, yielding a progress event per stage
+
+    Each event is a dict with "stage" and "progress"; the terminal event
+    carries the report text under "report" (stage "report") or a message
+    under "message" (stage "error"). Streaming consumers (SSE) render the
+    events as they arrive; execute_workflow wraps this generator for
+    callers that only want the final string.
+    """
+
     # STEP 1: Receive and identify the investment opportunity document
     if not attached_file_ids:
-        # Fallback to globals for backward compatibility (for main.py usage)
-        attached_file_ids = globals().get('attached_file_ids', [])
-        
-    if not attached_file_ids:
-        return "Error: No investment opportunity document provided. Please provide document IDs to analyze."
-    
-    logger.info(f"Processing {len(attached_file_ids)} attached files: {attached_file_ids}")
-    
+        yield {"stage": "error", "progress": 1.0,
+               "message": "Error: No investment opportunity document provided. Please provide document IDs to analyze."}
+        return
+
+    logger.info("Processing %d attached files: %s", len(attached_file_ids), attached_file_ids)
+    yield {"stage": "search", "progress": 0.1}
+
     # STEP 2: Search for and retrieve the investment opportunity document
     try:
         search_result = await _search_documents(attached_file_ids)
         documents = search_result.get("documents", [])
-        
+
         if not documents:
-            return "Error: Could not retrieve the investment opportunity document. Please check document IDs."
-        
+            yield {"stage": "error", "progress": 1.0,
+                   "message": "Error: Could not retrieve the investment opportunity document. Please check document IDs."}
+            return
+
         document_ids = [str(doc["id"]) for doc in documents]
-        logger.info(f"Found {len(document_ids)} documents for analysis")
-        
+        logger.info("Found %d documents for analysis", len(document_ids))
+
     except Exception as e:
-        logger.error(f"Document search failed: {str(e)}")
-        return f"Error during document search: {str(e)}"
-    
+        logger.error("Document search failed: %s", e)
+        yield {"stage": "error", "progress": 1.0, "message": f"Error during document search: {str(e)}"}
+        return
+
+    yield {"stage": "analysis", "progress": 0.3}
+
     # STEP 3: Analyze the investment opportunity document
     try:
         detailed_analysis = await _analyze_documents(document_ids)
         logger.info("Document analysis completed successfully")
-        
+
     except Exception as e:
-        logger.error(f"Document analysis failed: {str(e)}")
-        return f"Error during document analysis: {str(e)}"
-    
+        logger.error("Document analysis failed: %s", e)
+        yield {"stage": "error", "progress": 1.0, "message": f"Error during document analysis: {str(e)}"}
+        return
+
+    yield {"stage": "evaluation", "progress": 0.7}
+
     # STEP 4-12: Evaluate all investment criteria
     try:
         criteria_evaluations = await _evaluate_all_criteria(detailed_analysis)
         logger.info("All criteria evaluated successfully")
-        
+
     except Exception as e:
-        logger.error(f"Criteria evaluation failed: {str(e)}")
-        return f"Error during criteria evaluation: {str(e)}"
-    
+        logger.error("Criteria evaluation failed: %s", e)
+        yield {"stage": "error", "progress": 1.0, "message": f"Error during criteria evaluation: {str(e)}"}
+        return
+
+    yield {"stage": "reporting", "progress": 0.85}
+
     # STEP 13: Generate comprehensive investment screening report
     try:
         final_report = await _generate_final_report(detailed_analysis, criteria_evaluations)
         logger.info("Final report generated successfully")
-        return final_report
-        
+        yield {"stage": "report", "progress": 1.0, "report": final_report}
+
     except Exception as e:
-        logger.error(f"Report generation failed: {str(e)}")
-        return f"Error during report generation: {str(e)}"
+        logger.error("Report generation failed: %s", e)
+        yield {"stage": "error", "progress": 1.0, "message": f"Error during report generation: {str(e)}"}
+
+async def execute_workflow(user_input: str, attached_file_ids: List[int]) -> str:
+    """Execute the complete investment screening workflow
+
+    The document IDs come in as an explicit argument - no shared module
+    state - so concurrent screenings cannot race each other. Drives the
+    event generator to completion and returns the final report (or error
+    message), preserving the original non-streaming contract.
+    """
+    result = ""
+    async for event in execute_workflow_events(user_input, attached_file_ids):
+        if event["stage"] == "report":
+            result = event["report"]
+        elif event["stage"] == "error":
+            result = event["message"]
+    return result
 
 async def _search_documents(attached_file_ids: List[int]) -> Dict:
     """Search for investment opportunity documents"""
@@ -99,53 +212,36 @@ async def _search_documents(attached_file_ids: List[int]) -> Dict:
 
 async def _analyze_documents(document_ids: List[str]) -> str:
     """Analyze documents using the Paradigm client"""
-    analysis_query = """Please provide a comprehensive analysis of this investment opportunity document. Extract the following key information:
+    if len(document_ids) > MAX_DOCUMENTS_PER_BATCH:
+        # Analyze batches concurrently - each batch is an independent
+        # polling session, so total latency is roughly one analysis
+        # duration instead of one per batch. The semaphore keeps the
+        # number of in-flight analyses within API rate limits.
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
 
-1. Target company name and full legal entity structure
-2. Detailed business model description including products/services offered
-3. Geographic presence and expansion plans, specifically mentioning any GCC region intentions
-4. Financial information including current EBITDA status, runway to profitability, funding requirements, and dividend policy if mentioned
-5. Investment terms including proposed ticket size, management fees structure, and timeline expectations
-6. Sector classification and sub-sector details
-7. Return projections including IRR if provided
-8. Investor syndicate composition including lead investor status
-9. Partnership or joint venture structures if applicable
-10. Any mentions of KGI involvement or co-investment opportunities
+        async def _analyze_batch(batch: List[str]) -> str:
+            async with semaphore:
+                return await paradigm_client.analyze_documents_with_polling(ANALYSIS_QUERY, batch)
 
-Please be thorough and specific in your analysis, noting when information is not available."""
-    
-    if len(document_ids) > MAX_DOCUMENTS_PER_BATCH:
-        # Process in batches
-        analysis_results = []
-        for i in range(0, len(document_ids), MAX_DOCUMENTS_PER_BATCH):
-            batch = document_ids[i:i+MAX_DOCUMENTS_PER_BATCH]
-            result = await paradigm_client.analyze_documents_with_polling(analysis_query, batch)
-            analysis_results.append(result)
+        batches = [
+            document_ids[i:i+MAX_DOCUMENTS_PER_BATCH]
+            for i in range(0, len(document_ids), MAX_DOCUMENTS_PER_BATCH)
+        ]
+        analysis_results = await asyncio.gather(*(_analyze_batch(batch) for batch in batches))
         return "\n\n".join(analysis_results)
     else:
-        return await paradigm_client.analyze_documents_with_polling(analysis_query, document_ids)
+        return await paradigm_client.analyze_documents_with_polling(ANALYSIS_QUERY, document_ids)
 
-async def _evaluate_all_criteria(detailed_analysis: str) -> Dict[str, Dict[str, str]]:
+async def _evaluate_all_criteria(detailed_analysis: str) -> Dict[str, EvalResult]:
     """Evaluate all investment criteria"""
-    criteria_evaluations = {}
-    
-    # Evaluate each criterion
-    criteria_evaluations["Geography/Structure"] = evaluate_geography_structure(detailed_analysis)
-    criteria_evaluations["Financial Milestones"] = evaluate_financial_milestones(detailed_analysis)
-    criteria_evaluations["Asset Class Exclusion"] = evaluate_asset_class_exclusion(detailed_analysis)
-    criteria_evaluations["Investor Syndication"] = evaluate_investor_syndication(detailed_analysis)
-    criteria_evaluations["Fee Terms"] = evaluate_fee_terms(detailed_analysis)
-    criteria_evaluations["Investment Size"] = evaluate_investment_size(detailed_analysis)
-    criteria_evaluations["Process Timeline"] = evaluate_process_timeline(detailed_analysis)
-    criteria_evaluations["Return Threshold"] = evaluate_return_threshold(detailed_analysis)
-    
-    # Sector evaluation needs met criteria count for opportunistic consideration
-    met_count = count_met_criteria(criteria_evaluations)
-    criteria_evaluations["Sector Focus"] = evaluate_sector_focus(detailed_analysis, met_count)
-    
-    return criteria_evaluations
+    # The evaluators are pure CPU functions that already share one keyword
+    # scan, so fanning the nine of them out with asyncio.gather would only
+    # add task-scheduling overhead. Run the whole evaluation in a worker
+    # thread instead, so a large analysis text cannot stall the event loop
+    # while other screenings are in flight.
+    return await asyncio.to_thread(evaluate_all_criteria, detailed_analysis)
 
-async def _generate_final_report(detailed_analysis: str, criteria_evaluations: Dict[str, Dict[str, str]]) -> str:
+async def _generate_final_report(detailed_analysis: str, criteria_evaluations: Dict[str, EvalResult]) -> str:
     """Generate the final investment screening report"""
     current_date = datetime.now().strftime("%B %d, %Y")
     company_name = extract_company_name(detailed_analysis)
@@ -156,52 +252,41 @@ async def _generate_final_report(detailed_analysis: str, criteria_evaluations: D
     
     # Generate overall recommendation
     overall_recommendation = generate_overall_recommendation(met_count, total_count)
-    
-    report_prompt = f"""Generate a comprehensive investment screening report with the following information:
-
-COMPANY: {company_name}
-DATE: {current_date}
-ANALYSIS: {detailed_analysis}
-CRITERIA RESULTS: {json.dumps(criteria_evaluations, indent=2)}
-MET CRITERIA: {met_count}/{total_count}
-RECOMMENDATION: {overall_recommendation}
-
-Format the report exactly as follows:
-
-# INVESTMENT OPPORTUNITY SCREENING REPORT
-**Date:** {current_date}
-
-## {company_name}
 
-### Executive Summary
-[Provide 3-5 sentence overview of the opportunity including business model, investment size, and key highlights]
-
-### Detailed Opportunity Summary
-[Provide comprehensive business description, market opportunity, team background if available, and unique value proposition]
+    # One pass over the evaluations builds the criteria table, instead of
+    # indexing each criterion twice inside the template
+    criteria_rows = "\n".join(
+        f"| {result.color} {name} | {result.explanation} |"
+        for name, result in criteria_evaluations.items()
+    )
 
-### Investment Criteria Evaluation
+    # A clear reject needs no prose from the model - render the report
+    # locally and save the LLM roundtrip. The threshold is 1 rather than 0
+    # because Investor Syndication is always MET by policy, so <= 1 means
+    # every substantive criterion failed.
+    if SKIP_LLM_REPORT_ON_REJECT and met_count <= 1:
+        logger.info("No criteria met - rendering reject report locally, skipping LLM call")
+        return REJECT_REPORT_TEMPLATE.format(
+            company_name=company_name,
+            current_date=current_date,
+            criteria_rows=criteria_rows,
+            met_count=met_count,
+            total_count=total_count,
+            overall_recommendation=overall_recommendation
+        )
 
-| Criterion | Evaluation |
-|-----------|------------|
-| {criteria_evaluations["Geography/Structure"]["color"]} Geography/Structure | {criteria_evaluations["Geography/Structure"]["explanation"]} |
-| {criteria_evaluations["Financial Milestones"]["color"]} Financial Milestones | {criteria_evaluations["Financial Milestones"]["explanation"]} |
-| {criteria_evaluations["Asset Class Exclusion"]["color"]} Asset Class Exclusion | {criteria_evaluations["Asset Class Exclusion"]["explanation"]} |
-| {criteria_evaluations["Investor Syndication"]["color"]} Investor Syndication | {criteria_evaluations["Investor Syndication"]["explanation"]} |
-| {criteria_evaluations["Fee Terms"]["color"]} Fee Terms | {criteria_evaluations["Fee Terms"]["explanation"]} |
-| {criteria_evaluations["Investment Size"]["color"]} Investment Size | {criteria_evaluations["Investment Size"]["explanation"]} |
-| {criteria_evaluations["Process Timeline"]["color"]} Process Timeline | {criteria_evaluations["Process Timeline"]["explanation"]} |
-| {criteria_evaluations["Return Threshold"]["color"]} Return Threshold | {criteria_evaluations["Return Threshold"]["explanation"]} |
-| {criteria_evaluations["Sector Focus"]["color"]} Sector Focus | {criteria_evaluations["Sector Focus"]["explanation"]} |
+    report_prompt = REPORT_TEMPLATE.format(
+        company_name=company_name,
+        current_date=current_date,
+        detailed_analysis=detailed_analysis,
+        criteria_json=orjson.dumps(
+            {name: result._asdict() for name, result in criteria_evaluations.items()},
+            option=orjson.OPT_INDENT_2
+        ).decode(),
+        met_count=met_count,
+        total_count=total_count,
+        overall_recommendation=overall_recommendation,
+        criteria_rows=criteria_rows
+    )
 
-### Overall Recommendation
-{overall_recommendation}
-
-**Criteria Met:** {met_count} out of {total_count}
-
-### Key Risks and Considerations
-[List any applicable risks and considerations]
-
----
-*Report generated by Kanoo Ventures Investment Screening System*"""
-    
     return await paradigm_client.chat_completion(report_prompt)
\ No newline at end of file